@@ -5,6 +5,9 @@ from typing import Any
 
 import click
 
+# Results are decoded from JSON responses, so they cannot contain cycles.
+_encode_json = json.JSONEncoder(indent=2, default=str, check_circular=False).encode
+
 
 def format_output(data: Any, format_type: str = "text") -> str:
     """Format output based on requested format type.
@@ -27,8 +30,8 @@ def format_output(data: Any, format_type: str = "text") -> str:
 def format_as_json(data: Any) -> str:
     """Format data as pretty-printed JSON."""
     try:
-        return json.dumps(data, indent=2, default=str)
-    except (TypeError, ValueError) as e:
+        return _encode_json(data)
+    except (TypeError, ValueError, RecursionError) as e:
         return json.dumps({"error": f"JSON serialization failed: {e}", "raw": str(data)})
 
 
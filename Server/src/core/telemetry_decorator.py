@@ -17,6 +17,12 @@ _decorator_log_count = 0
 def telemetry_tool(tool_name: str):
     """Decorator to add telemetry tracking to MCP tools"""
     def decorator(func: Callable) -> Callable:
+        # Resolve the signature once; the wrappers only bind against it per call.
+        try:
+            sig = inspect.signature(func)
+        except (TypeError, ValueError):
+            sig = None
+
         @functools.wraps(func)
         def _sync_wrapper(*args, **kwargs) -> Any:
             start_time = time.time()
@@ -24,13 +30,13 @@ def telemetry_tool(tool_name: str):
             error = None
             # Extract sub-action (e.g., 'get_hierarchy') from bound args when available
             sub_action = None
-            try:
-                sig = inspect.signature(func)
-                bound = sig.bind_partial(*args, **kwargs)
-                bound.apply_defaults()
-                sub_action = bound.arguments.get("action")
-            except Exception:
-                sub_action = None
+            if sig is not None:
+                try:
+                    bound = sig.bind_partial(*args, **kwargs)
+                    bound.apply_defaults()
+                    sub_action = bound.arguments.get("action")
+                except Exception:
+                    sub_action = None
             try:
                 global _decorator_log_count
                 if _decorator_log_count < 10:
@@ -67,13 +73,13 @@ def telemetry_tool(tool_name: str):
             error = None
             # Extract sub-action (e.g., 'get_hierarchy') from bound args when available
             sub_action = None
-            try:
-                sig = inspect.signature(func)
-                bound = sig.bind_partial(*args, **kwargs)
-                bound.apply_defaults()
-                sub_action = bound.arguments.get("action")
-            except Exception:
-                sub_action = None
+            if sig is not None:
+                try:
+                    bound = sig.bind_partial(*args, **kwargs)
+                    bound.apply_defaults()
+                    sub_action = bound.arguments.get("action")
+                except Exception:
+                    sub_action = None
             try:
                 global _decorator_log_count
                 if _decorator_log_count < 10:
@@ -54,7 +54,7 @@ class ApiKeyService:
         self._cache_ttl = cache_ttl
         self._service_token_header = service_token_header
         self._service_token = service_token
-        # Cache: api_key -> (valid, user_id, metadata, expires_at)
+        # Cache: api_key -> (valid, user_id, metadata, expires_at on time.monotonic())
         self._cache: dict[str, tuple[bool, str |
                                      None, dict[str, Any] | None, float]] = {}
         self._cache_lock = asyncio.Lock()
@@ -91,7 +91,7 @@ class ApiKeyService:
             cached = self._cache.get(api_key)
             if cached is not None:
                 valid, user_id, metadata, expires_at = cached
-                if time.time() < expires_at:
+                if time.monotonic() < expires_at:
                     if valid:
                         return ValidationResult(valid=True, user_id=user_id, metadata=metadata)
                     else:
@@ -108,7 +108,11 @@ class ApiKeyService:
         # not be cached to avoid locking out users during service outages.
         if result.cacheable:
             async with self._cache_lock:
-                expires_at = time.time() + self._cache_ttl
+                now = time.monotonic()
+                # Drop entries for keys that expired without being looked up again.
+                for key in [k for k, v in self._cache.items() if v[3] <= now]:
+                    del self._cache[key]
+                expires_at = now + self._cache_ttl
                 self._cache[api_key] = (
                     result.valid,
                     result.user_id,
@@ -2,7 +2,6 @@ import asyncio
 import inspect
 import logging
 import time
-from hashlib import sha256
 from typing import Optional
 
 from fastmcp import Context, FastMCP
@@ -470,17 +469,6 @@ class CustomToolService:
             return value
 
 
-def compute_project_id(project_name: str, project_path: str) -> str:
-    """
-    DEPRECATED: Computes a SHA256-based project ID.
-    This function is no longer used as of the multi-session fix.
-    Unity instances now use their native project_hash (SHA1-based) for consistency
-    across stdio and WebSocket transports.
-    """
-    combined = f"{project_name}:{project_path}"
-    return sha256(combined.encode("utf-8")).hexdigest().upper()[:16]
-
-
 def resolve_project_id_for_unity_instance(unity_instance: str | None) -> str | None:
     if unity_instance is None:
         return None
@@ -222,14 +222,30 @@ def _enrich_advice_and_staleness(state_v2: dict[str, Any]) -> dict[str, Any]:
     description="Canonical editor readiness snapshot. Includes advice and server-computed staleness.\n\nURI: mcpforunity://editor/state",
 )
 async def get_editor_state(ctx: Context) -> MCPResponse:
+    return await fetch_editor_state(ctx)
+
+
+async def fetch_editor_state(ctx: Context, *, coalesce: bool = True) -> MCPResponse:
+    """Build the editor state snapshot for the targeted instance.
+
+    Concurrent reads share one round trip unless ``coalesce`` is False.
+    Readiness gates pass False after a mutation: joining a read sent before
+    the mutation would report the pre-mutation state.
+    """
     unity_instance = await get_unity_instance_from_context(ctx)
 
-    response = await unity_transport.send_with_unity_instance(
-        async_send_command_with_retry,
-        unity_instance,
-        "get_editor_state",
-        {},
-    )
+    def send():
+        return unity_transport.send_with_unity_instance(
+            async_send_command_with_retry,
+            unity_instance,
+            "get_editor_state",
+            {},
+        )
+
+    if coalesce:
+        response = await unity_transport.coalesce_read(("get_editor_state", unity_instance), send)
+    else:
+        response = await send()
 
     # If Unity returns a structured retry hint or error, surface it directly.
     if isinstance(response, dict) and not response.get("success", True):
@@ -259,17 +275,20 @@ async def get_editor_state(ctx: Context) -> MCPResponse:
     try:
         instance_id = unity_section.get("instance_id")
         if isinstance(instance_id, str) and instance_id.strip():
-            from services.resources.project_info import get_project_info
-
-            proj_resp = await get_project_info(ctx)
-            proj = proj_resp.model_dump() if hasattr(
-                proj_resp, "model_dump") else proj_resp
-            proj_data = proj.get("data") if isinstance(proj, dict) else None
-            project_root = proj_data.get("projectRoot") if isinstance(
-                proj_data, dict) else None
-            if isinstance(project_root, str) and project_root.strip():
-                external_changes_scanner.set_project_root(
-                    instance_id, project_root)
+            # The project root never changes for a Name@hash instance id, so only
+            # ask Unity for it until the scanner has one recorded.
+            if not external_changes_scanner.get_project_root(instance_id):
+                from services.resources.project_info import get_project_info
+
+                proj_resp = await get_project_info(ctx)
+                proj = proj_resp.model_dump() if hasattr(
+                    proj_resp, "model_dump") else proj_resp
+                proj_data = proj.get("data") if isinstance(proj, dict) else None
+                project_root = proj_data.get("projectRoot") if isinstance(
+                    proj_data, dict) else None
+                if isinstance(project_root, str) and project_root.strip():
+                    external_changes_scanner.set_project_root(
+                        instance_id, project_root)
 
             ext = external_changes_scanner.update_and_get(instance_id)
 
@@ -53,6 +53,10 @@ class ExternalChangesScanner:
         if project_root:
             st.project_root = project_root
 
+    def get_project_root(self, instance_id: str) -> str | None:
+        st = self._states.get(instance_id)
+        return st.project_root if st else None
+
     def clear_dirty(self, instance_id: str) -> None:
         st = self._get_state(instance_id)
         st.dirty = False
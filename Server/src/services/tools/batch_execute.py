@@ -91,11 +91,14 @@ async def batch_execute(
         raise ValueError(
             "'commands' must be a non-empty list of command specifications")
 
-    max_commands = await _get_max_commands_from_editor_state(ctx)
-    if len(commands) > max_commands:
-        raise ValueError(
-            f"batch_execute supports up to {max_commands} commands (configured in Unity); received {len(commands)}"
-        )
+    # Unity enforces its configured limit itself, so only spend an editor_state
+    # round trip on the limit when the batch exceeds what we already know fits.
+    if len(commands) > (_cached_max_commands or DEFAULT_MAX_COMMANDS_PER_BATCH):
+        max_commands = await _get_max_commands_from_editor_state(ctx)
+        if len(commands) > max_commands:
+            raise ValueError(
+                f"batch_execute supports up to {max_commands} commands (configured in Unity); received {len(commands)}"
+            )
 
     normalized_commands: list[dict[str, Any]] = []
     for index, command in enumerate(commands):
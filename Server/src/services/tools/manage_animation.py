@@ -29,6 +29,7 @@ CLIP_ACTIONS = [
 ]
 
 ALL_ACTIONS = ANIMATOR_ACTIONS + CONTROLLER_ACTIONS + CLIP_ACTIONS #Not loaded in the MCP context, but will return this in the error response (1 Shot)
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -64,7 +65,7 @@ async def manage_animation(
 
     action_normalized = action.lower()
 
-    if action_normalized not in ALL_ACTIONS:
+    if action_normalized not in _VALID_ACTIONS:
         prefix = action_normalized.split("_")[0] + "_" if "_" in action_normalized else ""
         available_by_prefix = {
             "animator_": ANIMATOR_ACTIONS,
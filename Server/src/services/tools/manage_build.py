@@ -21,6 +21,7 @@ ALL_ACTIONS = [
     "batch",
     "cancel",
 ]
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 async def _send_build_command(
@@ -70,7 +71,7 @@ async def manage_build(
     if action_lower not in ALL_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     params_dict: dict[str, Any] = {"action": action_lower}
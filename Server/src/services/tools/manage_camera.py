@@ -29,6 +29,8 @@ CONTROL_ACTIONS = [
 CAPTURE_ACTIONS = ["screenshot", "screenshot_multiview"]
 
 ALL_ACTIONS = SETUP_ACTIONS + CREATION_ACTIONS + CONFIGURATION_ACTIONS + EXTENSION_ACTIONS + CONTROL_ACTIONS + CAPTURE_ACTIONS
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
+_CAPTURE_ACTIONS = frozenset(CAPTURE_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -127,7 +129,7 @@ async def manage_camera(
 
     action_normalized = action.lower()
 
-    if action_normalized not in ALL_ACTIONS:
+    if action_normalized not in _VALID_ACTIONS:
         categories = {
             "Setup": SETUP_ACTIONS,
             "Creation": CREATION_ACTIONS,
@@ -158,7 +160,8 @@ async def manage_camera(
         params_dict["searchMethod"] = search_method
 
     # Screenshot params — only relevant for screenshot/screenshot_multiview actions
-    if action_normalized in CAPTURE_ACTIONS:
+    is_capture = action_normalized in _CAPTURE_ACTIONS
+    if is_capture:
         err = build_screenshot_params(
             params_dict,
             screenshot_file_name=screenshot_file_name,
@@ -190,7 +193,7 @@ async def manage_camera(
         return {"success": False, "message": str(result)}
 
     # For capture actions, check for inline images to return as ImageContent
-    if action_normalized in CAPTURE_ACTIONS:
+    if is_capture:
         image_result = extract_screenshot_images(result)
         if image_result is not None:
             return image_result
@@ -45,6 +45,8 @@ ALL_ACTIONS = (
     ["ping"] + VOLUME_ACTIONS + BAKE_ACTIONS + STATS_ACTIONS
     + PIPELINE_ACTIONS + FEATURE_ACTIONS + SKYBOX_ACTIONS
 )
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -127,10 +129,10 @@ async def manage_graphics(
     reflection_mode: Annotated[Optional[str], "Default reflection mode: Skybox, Custom."] = None,
 ) -> dict[str, Any]:
     action_lower = action.lower()
-    if action_lower not in ALL_ACTIONS:
+    if action_lower not in _VALID_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     unity_instance = await get_unity_instance_from_context(ctx)
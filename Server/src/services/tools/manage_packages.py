@@ -13,6 +13,8 @@ ALL_ACTIONS = [
     "add_package", "remove_package", "embed_package", "resolve_packages",
     "add_registry", "remove_registry", "list_registries",
 ]
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 async def _send_packages_command(
@@ -65,10 +67,10 @@ async def manage_packages(
     scopes: Annotated[Optional[list[str]], "Registry scopes for add_registry."] = None,
 ) -> dict[str, Any]:
     action_lower = action.lower()
-    if action_lower not in ALL_ACTIONS:
+    if action_lower not in _VALID_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     params_dict: dict[str, Any] = {"action": action_lower}
@@ -33,6 +33,8 @@ PhysicsAction = Literal[
 ]
 
 ALL_ACTIONS: list[str] = list(get_args(PhysicsAction))
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -187,10 +189,10 @@ async def manage_physics(
     """Manage 3D and 2D physics: settings, collision matrix, materials, joints, queries, validation, simulation."""
 
     action_lower = action.lower()
-    if action_lower not in ALL_ACTIONS:
+    if action_lower not in _VALID_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid: {_VALID_ACTIONS_TEXT}",
         }
 
     unity_instance = await get_unity_instance_from_context(ctx)
@@ -45,6 +45,7 @@ ALL_ACTIONS = (
     ["ping"] + SHAPE_ACTIONS + MESH_ACTIONS + VERTEX_ACTIONS + SELECTION_ACTIONS
     + UV_MATERIAL_ACTIONS + QUERY_ACTIONS + SMOOTHING_ACTIONS + UTILITY_ACTIONS
 )
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
 
 @mcp_for_unity_tool(
     group="probuilder",
@@ -127,7 +128,7 @@ async def manage_probuilder(
 
     action_normalized = action.lower()
 
-    if action_normalized not in ALL_ACTIONS:
+    if action_normalized not in _VALID_ACTIONS:
         # Provide helpful category-based suggestions
         categories = {
             "Shape creation": SHAPE_ACTIONS,
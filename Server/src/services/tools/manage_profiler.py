@@ -30,6 +30,8 @@ ALL_ACTIONS = (
     UTILITY_ACTIONS + SESSION_ACTIONS + COUNTER_ACTIONS
     + MEMORY_SNAPSHOT_ACTIONS + FRAME_DEBUGGER_ACTIONS
 )
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -77,10 +79,10 @@ async def manage_profiler(
     cursor: Annotated[Optional[int], "Cursor offset for frame_debugger_get_events."] = None,
 ) -> dict[str, Any]:
     action_lower = action.lower()
-    if action_lower not in ALL_ACTIONS:
+    if action_lower not in _VALID_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     unity_instance = await get_unity_instance_from_context(ctx)
@@ -6,10 +6,15 @@ from mcp.types import ToolAnnotations
 from services.registry import mcp_for_unity_tool
 from services.tools import get_unity_instance_from_context
 from services.tools.utils import coerce_int, coerce_bool
-from transport.unity_transport import send_with_unity_instance
+from transport.unity_transport import coalesce_read, send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 from services.tools.preflight import preflight
 
+# Read-only actions whose concurrent identical calls share one Unity round trip.
+_READ_ACTIONS = frozenset({
+    "get_hierarchy", "get_active", "get_build_settings", "get_loaded_scenes",
+})
+
 
 @mcp_for_unity_tool(
     description=(
@@ -147,7 +152,16 @@ async def manage_scene(
             params["autoRepair"] = coerced_auto_repair
 
         # Use centralized retry helper with instance routing
-        response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_scene", params)
+        if action in _READ_ACTIONS:
+            response = await coalesce_read(
+                ("manage_scene", unity_instance, tuple(sorted(params.items()))),
+                lambda: send_with_unity_instance(
+                    async_send_command_with_retry, unity_instance, "manage_scene", params),
+                # The response is only read below, so callers can share it.
+                copy_result=False,
+            )
+        else:
+            response = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "manage_scene", params)
 
         # Preserve structured failure data; unwrap success into a friendlier shape
         if isinstance(response, dict) and response.get("success"):
@@ -20,6 +20,11 @@ from transport.legacy.unity_connection import async_send_command_with_retry
 
 _VALID_EXTENSIONS = {".uxml", ".uss"}
 
+_MUTATING_ACTIONS = frozenset({
+    "create", "update", "delete", "attach_ui_document", "detach_ui_document",
+    "create_panel_settings", "update_panel_settings", "render_ui", "link_stylesheet", "modify_visual_element",
+})
+
 
 @mcp_for_unity_tool(
     group="ui",
@@ -180,14 +185,12 @@ async def manage_ui(
         "action": action_lower,
     }
 
-    # File operations: base64-encode contents for transport
+    # File operations: base64-encode contents for transport. Missing contents
+    # are left for Unity to validate and report.
     if action_lower in ("create", "update") and contents:
         params_dict["encodedContents"] = base64.b64encode(
             contents.encode("utf-8")).decode("utf-8")
         params_dict["contentsEncoded"] = True
-    elif action_lower in ("create", "update") and not contents:
-        # Let Unity-side validate and return the error
-        pass
 
     if path is not None:
         params_dict["path"] = path
@@ -253,10 +256,7 @@ async def manage_ui(
         params_dict["tooltip"] = tooltip
 
     # --- Route to Unity ---
-    is_mutation = action_lower in (
-        "create", "update", "delete", "attach_ui_document", "detach_ui_document",
-        "create_panel_settings", "update_panel_settings", "render_ui", "link_stylesheet", "modify_visual_element",
-    )
+    is_mutation = action_lower in _MUTATING_ACTIONS
 
     if is_mutation:
         result = await send_mutation(
@@ -40,6 +40,7 @@ TRAIL_ACTIONS = [
 ]
 
 ALL_ACTIONS = ["ping"] + PARTICLE_ACTIONS + VFX_ACTIONS + LINE_ACTIONS + TRAIL_ACTIONS
+_VALID_ACTIONS = frozenset(ALL_ACTIONS)
 
 
 @mcp_for_unity_tool(
@@ -78,7 +79,7 @@ async def manage_vfx(
     action_normalized = action.lower()
 
     # Validate action against known actions using normalized value
-    if action_normalized not in ALL_ACTIONS:
+    if action_normalized not in _VALID_ACTIONS:
         # Provide helpful error with closest matches by prefix
         prefix = action_normalized.split(
             "_")[0] + "_" if "_" in action_normalized else ""
@@ -115,8 +116,6 @@ async def manage_vfx(
     if component_index is not None:
         params_dict["componentIndex"] = component_index
 
-    params_dict = {k: v for k, v in params_dict.items() if v is not None}
-
     # Send to Unity
     result = await send_with_unity_instance(
         async_send_command_with_retry,
@@ -44,8 +44,8 @@ async def preflight(
 
     # Load canonical editor state (server enriches advice + staleness).
     try:
-        from services.resources.editor_state import get_editor_state
-        state_resp = await get_editor_state(ctx)
+        from services.resources.editor_state import fetch_editor_state
+        state_resp = await fetch_editor_state(ctx, coalesce=False)
         state = state_resp.model_dump() if hasattr(
             state_resp, "model_dump") else state_resp
     except Exception:
@@ -95,8 +95,8 @@ async def preflight(
 
             # Refresh state for the next loop iteration.
             try:
-                from services.resources.editor_state import get_editor_state
-                state_resp = await get_editor_state(ctx)
+                from services.resources.editor_state import fetch_editor_state
+                state_resp = await fetch_editor_state(ctx, coalesce=False)
                 state = state_resp.model_dump() if hasattr(
                     state_resp, "model_dump") else state_resp
                 data = state.get("data") if isinstance(state, dict) else None
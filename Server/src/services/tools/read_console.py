@@ -12,6 +12,9 @@ from services.tools.utils import coerce_int, coerce_bool, parse_json_payload
 from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
+_ALLOWED_TYPES = frozenset({"error", "warning", "log", "all"})
+_ALLOWED_TYPES_TEXT = str(sorted(_ALLOWED_TYPES))
+
 
 def _strip_stacktrace_from_list(items: list) -> None:
     """Remove stacktrace fields from a list of log entries."""
@@ -64,7 +67,6 @@ async def read_console(
             )
         }
     if types is not None:
-        allowed_types = {"error", "warning", "log", "all"}
         normalized_types = []
         for entry in types:
             if not isinstance(entry, str):
@@ -73,12 +75,12 @@ async def read_console(
                     "message": f"types entries must be strings, got {type(entry).__name__}"
                 }
             normalized = entry.strip().lower()
-            if normalized not in allowed_types:
+            if normalized not in _ALLOWED_TYPES:
                 return {
                     "success": False,
                     "message": (
                         f"invalid types entry '{entry}'. "
-                        f"Allowed values: {sorted(allowed_types)}"
+                        f"Allowed values: {_ALLOWED_TYPES_TEXT}"
                     )
                 }
             normalized_types.append(normalized)
@@ -122,14 +124,10 @@ async def read_console(
         "includeStacktrace": include_stacktrace
     }
 
-    # Remove None values unless it's 'count' (as None might mean 'all')
+    # Remove None values unless it's 'count': an explicit null means 'all' to the C# handler
     params_dict = {k: v for k, v in params_dict.items()
                    if v is not None or k == 'count'}
 
-    # Add count back if it was None, explicitly sending null might be important for C# logic
-    if 'count' not in params_dict:
-        params_dict['count'] = None
-
     # Use centralized retry helper with instance routing
     resp = await send_with_unity_instance(async_send_command_with_retry, unity_instance, "read_console", params_dict)
     if isinstance(resp, dict) and resp.get("success") and not include_stacktrace:
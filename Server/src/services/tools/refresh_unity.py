@@ -25,6 +25,12 @@ logger = logging.getLogger(__name__)
 # Must match activityPhase values from EditorStateCache.cs
 _REAL_BLOCKING_REASONS = {"compiling", "domain_reload", "running_tests", "asset_import"}
 
+# Readiness polling starts fast to catch quick compiles, then backs off so a
+# long domain reload is not polled several times a second.
+_READY_POLL_INITIAL_S = 0.1
+_READY_POLL_MAX_S = 1.0
+_READY_POLL_BACKOFF = 1.5
+
 
 def _in_pytest() -> bool:
     """Return True when running inside pytest to avoid polling unmocked resources."""
@@ -42,9 +48,10 @@ async def wait_for_editor_ready(ctx: Context, timeout_s: float = 30.0) -> tuple[
         return (True, 0.0)
 
     start = time.monotonic()
+    poll_interval = _READY_POLL_INITIAL_S
     while time.monotonic() - start < timeout_s:
         try:
-            state_resp = await editor_state.get_editor_state(ctx)
+            state_resp = await editor_state.fetch_editor_state(ctx, coalesce=False)
             state = state_resp.model_dump() if hasattr(state_resp, "model_dump") else state_resp
             data = (state or {}).get("data") if isinstance(state, dict) else None
             advice = (data or {}).get("advice") if isinstance(data, dict) else None
@@ -56,7 +63,11 @@ async def wait_for_editor_ready(ctx: Context, timeout_s: float = 30.0) -> tuple[
                     return (True, time.monotonic() - start)
         except Exception:
             pass  # not ready yet — keep polling
-        await asyncio.sleep(0.25)
+        remaining = timeout_s - (time.monotonic() - start)
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(poll_interval, remaining))
+        poll_interval = min(poll_interval * _READY_POLL_BACKOFF, _READY_POLL_MAX_S)
 
     return (False, time.monotonic() - start)
 
@@ -13,6 +13,9 @@ from services.tools.utils import parse_json_payload
 from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
+# Default options for whole-file text writes; caller-supplied keys win.
+_DEFAULT_TEXT_WRITE_OPTIONS = {"validate": "standard", "refresh": "debounced"}
+
 
 def _iter_csharp_tokens(text: str):
     """Iterate over C# source text yielding (position, char, is_code, interp_depth).
@@ -744,6 +747,10 @@ async def script_apply_edits(
     edits = parse_json_payload(edits)
     if not isinstance(edits, list):
         return {"success": False, "message": f"Edits must be a list or JSON string of a list, got {type(edits)}"}
+    if not edits:
+        # Unity rejects an empty edit list; answer locally instead of spending the
+        # get_sha/read round trips and a mutation wait on a guaranteed error.
+        return {"success": False, "message": "No edits provided."}
 
     # Normalize locator first so downstream calls target the correct script file.
     name, path = _normalize_script_locator(name, path)
@@ -1325,9 +1332,7 @@ async def script_apply_edits(
 
     # 3) update to Unity
     # Default refresh/validate for natural usage on text path as well
-    options = dict(options or {})
-    options.setdefault("validate", "standard")
-    options.setdefault("refresh", "debounced")
+    options = {**_DEFAULT_TEXT_WRITE_OPTIONS, **(options or {})}
 
     # Compute the SHA of the current file contents for the precondition
     old_lines = contents.splitlines(keepends=True)
@@ -1351,7 +1356,7 @@ async def script_apply_edits(
             }
         ],
         "precondition_sha256": sha,
-        "options": options or {"validate": "standard", "refresh": "debounced"},
+        "options": options,
     }
 
     async def _verify_write():
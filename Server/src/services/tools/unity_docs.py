@@ -11,6 +11,7 @@ from mcp.types import ToolAnnotations
 from services.registry import mcp_for_unity_tool
 
 ALL_ACTIONS = ["get_doc", "get_manual", "get_package_doc", "lookup"]
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 
 # ---------------------------------------------------------------------------
@@ -736,7 +737,7 @@ async def unity_docs(
     if action_lower not in ALL_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     if action_lower == "get_doc":
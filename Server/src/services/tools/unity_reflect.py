@@ -9,6 +9,7 @@ from transport.unity_transport import send_with_unity_instance
 from transport.legacy.unity_connection import async_send_command_with_retry
 
 ALL_ACTIONS = ["get_type", "get_member", "search"]
+_VALID_ACTIONS_TEXT = ", ".join(ALL_ACTIONS)
 
 VALID_SCOPES = ["unity", "packages", "project", "all"]
 
@@ -53,7 +54,7 @@ async def unity_reflect(
     if action_lower not in ALL_ACTIONS:
         return {
             "success": False,
-            "message": f"Unknown action '{action}'. Valid actions: {', '.join(ALL_ACTIONS)}",
+            "message": f"Unknown action '{action}'. Valid actions: {_VALID_ACTIONS_TEXT}",
         }
 
     # Validate required params per action
@@ -421,10 +421,16 @@ def extract_screenshot_images(response: dict[str, Any]) -> "ToolResult | None":
     # Batch images (surround/orbit mode) — multiple screenshots in one response
     screenshots = data.get("screenshots")
     if screenshots and isinstance(screenshots, list):
-        blocks: list[TextContent | ImageContent] = []
+        # Single pass: the base64 payloads are passed through untouched, and the
+        # summary block is prepended once the per-angle metadata is collected.
+        image_blocks: list[TextContent | ImageContent] = []
         summary_screenshots = []
         for s in screenshots:
             summary_screenshots.append({k: v for k, v in s.items() if k != "imageBase64"})
+            b64 = s.get("imageBase64")
+            if b64:
+                image_blocks.append(TextContent(type="text", text=f"[Angle: {s.get('angle', '?')}]"))
+                image_blocks.append(ImageContent(type="image", data=b64, mimeType="image/png"))
         text_result = {
             "success": True,
             "message": response.get("message", ""),
@@ -434,13 +440,7 @@ def extract_screenshot_images(response: dict[str, Any]) -> "ToolResult | None":
                 "screenshots": summary_screenshots,
             },
         }
-        blocks.append(TextContent(type="text", text=json.dumps(text_result)))
-        for s in screenshots:
-            b64 = s.get("imageBase64")
-            if b64:
-                blocks.append(TextContent(type="text", text=f"[Angle: {s.get('angle', '?')}]"))
-                blocks.append(ImageContent(type="image", data=b64, mimeType="image/png"))
-        return ToolResult(content=blocks)
+        return ToolResult(content=[TextContent(type="text", text=json.dumps(text_result)), *image_blocks])
 
     # Single image (include_image or positioned capture) or contact sheet
     image_b64 = data.get("imageBase64")
@@ -19,19 +19,19 @@ class StdioPortRegistry:
     def __init__(self) -> None:
         self._lock = threading.RLock()
         self._instances: dict[str, UnityInstanceInfo] = {}
-        self._last_refresh: float = 0.0
+        self._last_refresh: float = float("-inf")
 
     def _refresh_locked(self) -> None:
         instances = PortDiscovery.discover_all_unity_instances()
         self._instances = {inst.id: inst for inst in instances}
-        self._last_refresh = time.time()
+        self._last_refresh = time.monotonic()
         logger.debug(
             f"STDIO port registry refreshed with {len(instances)} instance(s)")
 
     def get_instances(self, *, force_refresh: bool = False) -> list[UnityInstanceInfo]:
         ttl = getattr(config, "port_registry_ttl", 5.0)
         with self._lock:
-            now = time.time()
+            now = time.monotonic()
             if not force_refresh and self._instances and (now - self._last_refresh) < ttl:
                 return list(self._instances.values())
             self._refresh_locked()
@@ -59,7 +59,7 @@ class StdioPortRegistry:
     def clear(self) -> None:
         with self._lock:
             self._instances.clear()
-            self._last_refresh = 0.0
+            self._last_refresh = float("-inf")
 
 
 stdio_port_registry = StdioPortRegistry()
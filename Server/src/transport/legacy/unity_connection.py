@@ -26,6 +26,9 @@ _connection_lock = threading.Lock()
 # Maximum allowed framed payload size (64 MiB)
 FRAMED_MAX = 64 * 1024 * 1024
 
+# How often a reload backoff re-checks the status file for the reload ending
+_RELOAD_POLL_S = 0.25
+
 
 @dataclass
 class UnityConnection:
@@ -186,7 +189,7 @@ class UnityConnection:
                     if payload_len == 0:
                         heartbeat_count += 1
                         logger.debug(
-                            f"Received heartbeat frame #{heartbeat_count}")
+                            "Received heartbeat frame #%d", heartbeat_count)
                         if heartbeat_count >= heartbeat_limit or (time.monotonic() - heartbeat_started) > heartbeat_window:
                             raise TimeoutError(
                                 "Unity sent heartbeat frames without payload within configured threshold"
@@ -197,7 +200,7 @@ class UnityConnection:
                             f"Invalid framed length: {payload_len}")
                     payload = self._read_exact(sock, payload_len)
                     logger.debug(
-                        f"Received framed response ({len(payload)} bytes)")
+                        "Received framed response (%d bytes)", len(payload))
                     return payload
             except socket.timeout as exc:
                 logger.warning("Socket timeout during framed receive")
@@ -220,6 +223,11 @@ class UnityConnection:
                     break
                 chunks.append(chunk)
 
+                # A complete JSON object ends with '}'; skip re-decoding and
+                # re-parsing the whole buffer for chunks that cannot finish it.
+                if chunk.rstrip()[-1:] != b'}':
+                    continue
+
                 # Process the data received so far
                 data = b''.join(chunks)
                 decoded_data = data.decode('utf-8')
@@ -335,6 +343,15 @@ class UnityConnection:
         except Exception as exc:
             logger.debug(f"Preflight status check failed: {exc}")
 
+        # Encode once; retries resend the same bytes.
+        if command_type == 'ping':
+            payload = b'ping'
+        else:
+            payload = json.dumps(
+                {'type': command_type, 'params': params},
+                separators=(',', ':'),
+            ).encode('utf-8')
+
         for attempt in range(attempts + 1):
             try:
                 # Discard stale sockets left over from a previous domain reload
@@ -346,26 +363,20 @@ class UnityConnection:
                     raise ConnectionError("Could not connect to Unity")
                 logger.info("[TIMING-STDIO] connect took %.3fs command=%s", time.time() - t_conn_start, command_type)
 
-                # Build payload
-                if command_type == 'ping':
-                    payload = b'ping'
-                else:
-                    payload = json.dumps({
-                        'type': command_type,
-                        'params': params,
-                    }).encode('utf-8')
-
                 # Send/receive are serialized to protect the shared socket
                 with self._io_lock:
+                    # Only build the wire-trace strings when they will be emitted.
+                    trace = logger.isEnabledFor(logging.DEBUG)
                     mode = 'framed' if self.use_framing else 'legacy'
-                    with contextlib.suppress(Exception):
+                    if trace:
                         logger.debug(
-                            f"send {len(payload)} bytes; mode={mode}; head={payload[:32].decode('utf-8', 'ignore')}")
+                            "send %d bytes; mode=%s; head=%s",
+                            len(payload), mode, payload[:32].decode('utf-8', 'ignore'))
                     t_send_start = time.time()
                     if self.use_framing:
-                        header = struct.pack('>Q', len(payload))
-                        self.sock.sendall(header)
-                        self.sock.sendall(payload)
+                        # One write per frame: a separate 8-byte header write
+                        # costs an extra syscall and can stall on Nagle/delayed ACK.
+                        self.sock.sendall(struct.pack('>Q', len(payload)) + payload)
                     else:
                         self.sock.sendall(payload)
                     logger.info("[TIMING-STDIO] sendall took %.3fs command=%s", time.time() - t_send_start, command_type)
@@ -379,9 +390,9 @@ class UnityConnection:
                         t_recv_start = time.time()
                         response_data = self.receive_full_response(self.sock)
                         logger.info("[TIMING-STDIO] receive took %.3fs command=%s len=%d", time.time() - t_recv_start, command_type, len(response_data))
-                        with contextlib.suppress(Exception):
+                        if trace:
                             logger.debug(
-                                f"recv {len(response_data)} bytes; mode={mode}")
+                                "recv %d bytes; mode=%s", len(response_data), mode)
                     finally:
                         if restore_timeout is not None:
                             self.sock.settimeout(restore_timeout)
@@ -459,7 +470,8 @@ class UnityConnection:
                             pass
 
                     # Cap backoff depending on state
-                    if status and status.get('reloading'):
+                    reloading = bool(status and status.get('reloading'))
+                    if reloading:
                         # Domain reload can take 10-20s; use longer waits
                         cap = 5.0
                     elif fast_error:
@@ -468,7 +480,27 @@ class UnityConnection:
                         cap = 3.0
 
                     sleep_s = min(cap, jitter * (2 ** attempt))
-                    time.sleep(sleep_s)
+                    if reloading:
+                        # Wait in short slices and retry as soon as Unity
+                        # reports the reload finished, instead of sleeping
+                        # out the whole backoff.
+                        deadline = time.monotonic() + sleep_s
+                        while True:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            time.sleep(min(_RELOAD_POLL_S, remaining))
+                            refreshed = read_status_file(target_hash)
+                            if not isinstance(refreshed, dict):
+                                # Missing or unreadable status proves nothing;
+                                # sleep out the backoff rather than re-reading
+                                # (and re-warning) every slice.
+                                time.sleep(max(0.0, deadline - time.monotonic()))
+                                break
+                            if 'reloading' in refreshed and not refreshed['reloading']:
+                                break
+                    else:
+                        time.sleep(sleep_s)
                     continue
                 raise
 
@@ -483,7 +515,7 @@ class UnityConnectionPool:
     def __init__(self):
         self._connections: dict[str, UnityConnection] = {}
         self._known_instances: dict[str, UnityInstanceInfo] = {}
-        self._last_full_scan: float = 0
+        self._last_full_scan: float = float("-inf")
         self._scan_interval: float = 5.0  # Cache for 5 seconds
         self._pool_lock = threading.Lock()
         self._default_instance_id: str | None = None
@@ -505,12 +537,12 @@ class UnityConnectionPool:
         Returns:
             List of UnityInstanceInfo objects
         """
-        now = time.time()
+        now = time.monotonic()
 
         # Return cached results if valid
         if not force_refresh and (now - self._last_full_scan) < self._scan_interval:
             logger.debug(
-                f"Returning cached Unity instances (age: {now - self._last_full_scan:.1f}s)")
+                "Returning cached Unity instances (age: %.1fs)", now - self._last_full_scan)
             return list(self._known_instances.values())
 
         # Scan for instances
@@ -549,7 +581,7 @@ class UnityConnectionPool:
         if instance_identifier is None:
             if self._default_instance_id:
                 instance_identifier = self._default_instance_id
-                logger.debug(f"Using default instance: {instance_identifier}")
+                logger.debug("Using default instance: %s", instance_identifier)
             else:
                 # Use the most recently active instance
                 # Instances with no heartbeat (None) should be sorted last (use 0 as sentinel)
@@ -676,7 +708,7 @@ class UnityConnectionPool:
                     logger.info(
                         f"Updating cached port for {target.id}: {conn.port} -> {target.port}")
                     conn.port = target.port
-                logger.debug(f"Reusing existing connection to: {target.id}")
+                logger.debug("Reusing existing connection to: %s", target.id)
 
             return self._connections[target.id]
 
@@ -935,33 +967,38 @@ async def async_send_command_with_retry(
         import asyncio  # local import to avoid mandatory asyncio dependency for sync callers
         if loop is None:
             loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: send_command_with_retry(
+
+        def _send() -> tuple[dict[str, Any] | MCPResponse, bool]:
+            result = send_command_with_retry(
                 command_type, params, instance_id=instance_id, max_retries=max_retries,
-                retry_ms=retry_ms, retry_on_reload=retry_on_reload),
-        )
+                retry_ms=retry_ms, retry_on_reload=retry_on_reload)
 
-        # After a successful command, check if the connection was freshly
-        # established (reconnection after domain reload).  If so, re-sync
-        # tool visibility and custom tool registration from Unity.
-        # Always clear the flag, but only schedule the background resync
-        # when this call is not itself get_tool_states (to avoid recursion).
-        try:
-            pool = get_unity_connection_pool()
-            conn = pool.get_connection(instance_id)
-            if getattr(conn, "_needs_tool_resync", False):
-                conn._needs_tool_resync = False
-                if command_type != "get_tool_states":
-                    logger.info(
-                        "Detected reconnection to Unity; scheduling tool re-sync"
-                    )
-                    asyncio.ensure_future(_resync_tools_after_reconnect(instance_id))
-        except Exception as exc:
-            logger.debug(
-                "Failed to schedule post-reconnection tool re-sync: %s",
-                exc,
+            # After a successful command, check if the connection was freshly
+            # established (reconnection after domain reload).  Resolving the
+            # connection may rescan instances or reconnect, so it stays on the
+            # worker thread; the flag is always cleared here.
+            needs_resync = False
+            try:
+                conn = get_unity_connection_pool().get_connection(instance_id)
+                if getattr(conn, "_needs_tool_resync", False):
+                    conn._needs_tool_resync = False
+                    needs_resync = True
+            except Exception as exc:
+                logger.debug(
+                    "Failed to check post-reconnection tool re-sync: %s",
+                    exc,
+                )
+            return result, needs_resync
+
+        result, needs_resync = await loop.run_in_executor(None, _send)
+
+        # Re-sync tool visibility and custom tool registration from Unity,
+        # unless this call is itself get_tool_states (to avoid recursion).
+        if needs_resync and command_type != "get_tool_states":
+            logger.info(
+                "Detected reconnection to Unity; scheduling tool re-sync"
             )
+            asyncio.ensure_future(_resync_tools_after_reconnect(instance_id))
 
         return result
     except Exception as e:
@@ -1,8 +1,10 @@
 """Transport helpers for routing commands to Unity."""
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
-from typing import Awaitable, Callable, TypeVar
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
 
 from transport.plugin_hub import PluginHub
 from core.config import config
@@ -14,6 +16,9 @@ from models.unity_response import normalize_unity_response
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
+# In-flight read-only commands, keyed by caller-supplied identity.
+_inflight_reads: dict[Hashable, _SharedRead] = {}
+
 
 def _is_http_transport() -> bool:
     return config.transport_mode.lower() == "http"
@@ -97,3 +102,62 @@ async def send_with_unity_instance(
     if unity_instance:
         kwargs.setdefault("instance_id", unity_instance)
     return await send_fn(*args, **kwargs)
+
+
+class _SharedRead:
+    """An in-flight read and the pristine copy kept for callers that joined it."""
+
+    __slots__ = ("task", "copy_result", "joiners", "snapshot")
+    task: asyncio.Future[Any]
+
+    def __init__(self, copy_result: bool) -> None:
+        self.copy_result = copy_result
+        self.joiners = 0
+        self.snapshot: Any = None
+
+
+async def coalesce_read(
+    key: Hashable,
+    send: Callable[[], Awaitable[T]],
+    *,
+    copy_result: bool = True,
+) -> T:
+    """Share one in-flight read-only request among concurrent identical callers.
+
+    The first caller for ``key`` starts ``send()`` and gets its result as-is;
+    callers arriving before it finishes await the same request. With
+    ``copy_result`` they each get a deep copy, for callers that enrich the
+    response in place; otherwise everyone shares one object. The first
+    caller's ``copy_result`` applies to the whole read. Remote-hosted
+    HTTP resolves the user per request, so reads are never shared there.
+    """
+    if config.http_remote_hosted:
+        return await send()
+
+    shared = _inflight_reads.get(key)
+    if shared is not None and not shared.task.done():
+        shared.joiners += 1
+        # Shield so one cancelled caller does not cancel the read for the others.
+        result = await asyncio.shield(shared.task)
+        return copy.deepcopy(shared.snapshot) if shared.copy_result else result
+
+    shared = _SharedRead(copy_result)
+
+    async def _lead() -> T:
+        result = await send()
+        # Snapshot before any caller resumes, so the first caller may mutate
+        # its result without the joiners seeing it.
+        if shared.copy_result and shared.joiners:
+            shared.snapshot = copy.deepcopy(result)
+        return result
+
+    shared.task = task = asyncio.ensure_future(_lead())
+    _inflight_reads[key] = shared
+
+    def _forget(_: asyncio.Future[Any]) -> None:
+        # A caller may already have replaced a finished entry with a new read.
+        if _inflight_reads.get(key) is shared:
+            del _inflight_reads[key]
+
+    task.add_done_callback(_forget)
+    return await asyncio.shield(task)
@@ -216,11 +216,34 @@ class TestCaching:
             async with svc._cache_lock:
                 key = "test-expiry-key-12345"
                 valid, user_id, metadata, _expires = svc._cache[key]
-                svc._cache[key] = (valid, user_id, metadata, time.time() - 1)
+                svc._cache[key] = (valid, user_id, metadata, time.monotonic() - 1)
 
             await svc.validate("test-expiry-key-12345")
             assert call_count == 2  # Had to re-validate
 
+    @pytest.mark.asyncio
+    async def test_expired_entries_purged_on_insert(self):
+        svc = _make_service(cache_ttl=300.0)
+        mock_resp = _mock_response(200, {"valid": True, "user_id": "u1"})
+
+        with patch("httpx.AsyncClient") as MockClient:
+            instance = AsyncMock()
+            instance.__aenter__ = AsyncMock(return_value=instance)
+            instance.__aexit__ = AsyncMock(return_value=False)
+            instance.post = AsyncMock(return_value=mock_resp)
+            MockClient.return_value = instance
+
+            await svc.validate("test-stale-key-123456")
+            async with svc._cache_lock:
+                key = "test-stale-key-123456"
+                valid, user_id, metadata, _expires = svc._cache[key]
+                svc._cache[key] = (valid, user_id, metadata, time.monotonic() - 1)
+
+            await svc.validate("test-fresh-key-123456")
+
+        assert "test-stale-key-123456" not in svc._cache
+        assert "test-fresh-key-123456" in svc._cache
+
     @pytest.mark.asyncio
     async def test_invalidate_cache(self):
         svc = _make_service(cache_ttl=300.0)
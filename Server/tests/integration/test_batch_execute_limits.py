@@ -0,0 +1,56 @@
+import pytest
+
+import services.tools.batch_execute as batch_module
+from services.tools.batch_execute import batch_execute
+
+from .test_helpers import DummyContext
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    calls = []
+
+    async def fake_send(send_fn, unity_instance, command_type, params, **kwargs):
+        calls.append((command_type, params))
+        return {"success": True}
+
+    monkeypatch.setattr(batch_module, "send_with_unity_instance", fake_send)
+    monkeypatch.setattr(batch_module, "_cached_max_commands", None)
+    return calls
+
+
+def _commands(count):
+    return [{"tool": "manage_scene", "params": {"action": "get_active"}} for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_small_batch_skips_editor_state_lookup(sent, monkeypatch):
+    async def fail_lookup(ctx):
+        raise AssertionError("limit lookup should not run for batches within the default")
+
+    monkeypatch.setattr(batch_module, "_get_max_commands_from_editor_state", fail_lookup)
+
+    await batch_execute(DummyContext(), commands=_commands(3))
+
+    assert [c[0] for c in sent] == ["batch_execute"]
+
+
+@pytest.mark.asyncio
+async def test_large_batch_checks_unity_limit(sent, monkeypatch):
+    async def lookup(ctx):
+        return 30
+
+    monkeypatch.setattr(batch_module, "_get_max_commands_from_editor_state", lookup)
+
+    await batch_execute(DummyContext(), commands=_commands(30))
+    with pytest.raises(ValueError, match="up to 30 commands"):
+        await batch_execute(DummyContext(), commands=_commands(31))
+
+
+@pytest.mark.asyncio
+async def test_cached_limit_below_default_still_rejects(sent, monkeypatch):
+    monkeypatch.setattr(batch_module, "_cached_max_commands", 5)
+
+    with pytest.raises(ValueError, match="up to 5 commands"):
+        await batch_execute(DummyContext(), commands=_commands(6))
+    assert sent == []
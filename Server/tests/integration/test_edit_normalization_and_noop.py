@@ -136,3 +136,22 @@ async def test_atomic_multi_span_and_relaxed(monkeypatch):
     last = sent["calls"][-1]
     assert last.get("options", {}).get("applyMode") == "atomic"
     assert last.get("options", {}).get("validate") == "relaxed"
+
+
+@pytest.mark.asyncio
+async def test_script_apply_edits_empty_list_skips_unity(monkeypatch):
+    from services.tools.script_apply_edits import script_apply_edits
+
+    async def fail_send(*args, **kwargs):
+        raise AssertionError("empty edit lists should not reach Unity")
+
+    import services.tools.script_apply_edits as sae
+    monkeypatch.setattr(sae, "send_with_unity_instance", fail_send)
+    monkeypatch.setattr(sae, "async_send_command_with_retry", fail_send)
+    monkeypatch.setattr(sae, "send_mutation", fail_send)
+
+    resp = await script_apply_edits(
+        DummyContext(), name="F", path="Assets/Scripts/F.cs", edits="[]",
+    )
+
+    assert resp == {"success": False, "message": "No edits provided."}
@@ -57,3 +57,143 @@ async def test_editor_state_v2_is_registered_and_has_contract_fields(monkeypatch
     assert "staleness" in data
 
 
+@pytest.mark.asyncio
+async def test_editor_state_fetches_project_root_once_per_instance(monkeypatch):
+    import services.resources.editor_state as editor_state
+    import services.resources.project_info as project_info
+    import transport.unity_transport as unity_transport
+    from services.state.external_changes_scanner import ExternalChangesScanner
+
+    async def fake_send_with_unity_instance(send_fn, unity_instance, command_type, params, **kwargs):
+        return {
+            "success": True,
+            "data": {"unity": {"instance_id": "Project@cafef00d"}},
+        }
+
+    project_info_calls = []
+
+    async def fake_get_project_info(ctx):
+        project_info_calls.append(ctx)
+        return {"success": True, "data": {"projectRoot": "/tmp/Project"}}
+
+    monkeypatch.setattr(unity_transport, "send_with_unity_instance", fake_send_with_unity_instance)
+    monkeypatch.setattr(project_info, "get_project_info", fake_get_project_info)
+    monkeypatch.setattr(editor_state, "external_changes_scanner", ExternalChangesScanner())
+
+    await editor_state.get_editor_state(DummyContext())
+    await editor_state.get_editor_state(DummyContext())
+
+    assert len(project_info_calls) == 1
+    assert editor_state.external_changes_scanner.get_project_root("Project@cafef00d") == "/tmp/Project"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_editor_state_reads_share_one_round_trip(monkeypatch):
+    import asyncio
+
+    import services.resources.editor_state as editor_state
+    import transport.unity_transport as unity_transport
+
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_send_with_unity_instance(send_fn, unity_instance, command_type, params, **kwargs):
+        calls.append(command_type)
+        await release.wait()
+        return {"success": True, "data": {"sequence": 7}}
+
+    monkeypatch.setattr(unity_transport, "send_with_unity_instance", fake_send_with_unity_instance)
+
+    readers = [
+        asyncio.ensure_future(editor_state.get_editor_state(DummyContext()))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*readers)
+
+    assert calls == ["get_editor_state"]
+    assert all(r.success and r.data["sequence"] == 7 for r in results)
+    assert unity_transport._inflight_reads == {}
+
+
+@pytest.mark.asyncio
+async def test_uncoalesced_editor_state_read_sends_its_own_request(monkeypatch):
+    import asyncio
+
+    import services.resources.editor_state as editor_state
+    import transport.unity_transport as unity_transport
+
+    calls = []
+    release = asyncio.Event()
+
+    async def fake_send_with_unity_instance(send_fn, unity_instance, command_type, params, **kwargs):
+        calls.append(command_type)
+        await release.wait()
+        return {"success": True, "data": {"sequence": len(calls)}}
+
+    monkeypatch.setattr(unity_transport, "send_with_unity_instance", fake_send_with_unity_instance)
+
+    # A readiness poll started after a mutation must not join an earlier read.
+    earlier = asyncio.ensure_future(editor_state.get_editor_state(DummyContext()))
+    await asyncio.sleep(0)
+    fresh = asyncio.ensure_future(editor_state.fetch_editor_state(DummyContext(), coalesce=False))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(earlier, fresh)
+
+    assert calls == ["get_editor_state", "get_editor_state"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_read_gives_first_caller_the_original(monkeypatch):
+    import asyncio
+
+    import transport.unity_transport as unity_transport
+
+    payload = {"data": {"items": [1, 2, 3]}}
+    release = asyncio.Event()
+
+    async def send():
+        await release.wait()
+        return payload
+
+    async def leader():
+        result = await unity_transport.coalesce_read("key", send)
+        # Mutating the first caller's result must not leak into the joiners.
+        result["data"]["items"].append(4)
+        return result
+
+    first = asyncio.ensure_future(leader())
+    await asyncio.sleep(0)
+    joiner = asyncio.ensure_future(unity_transport.coalesce_read("key", send))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is payload
+    assert (await joiner) == {"data": {"items": [1, 2, 3]}}
+    assert unity_transport._inflight_reads == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_read_joiner_follows_the_first_callers_copy_mode():
+    import asyncio
+
+    import transport.unity_transport as unity_transport
+
+    payload = {"data": 1}
+    release = asyncio.Event()
+
+    async def send():
+        await release.wait()
+        return payload
+
+    first = asyncio.ensure_future(unity_transport.coalesce_read("key", send, copy_result=False))
+    await asyncio.sleep(0)
+    joiner = asyncio.ensure_future(unity_transport.coalesce_read("key", send, copy_result=True))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is payload
+    assert await joiner is payload
+    assert unity_transport._inflight_reads == {}
@@ -426,3 +426,29 @@ class TestManageUILinkStylesheet:
         assert p["stylesheet"] == "Assets/UI/Styles.uss"
         for k in ("width", "height", "include_image"):
             assert k not in p
+
+
+class TestManageUIWireKeys:
+    """Tests for parameter wire-key mapping."""
+
+    def test_modify_visual_element_maps_wire_keys(self, monkeypatch):
+        captured = {}
+
+        async def fake_send(_ctx, _instance, _cmd, params, **kwargs):
+            captured["params"] = params
+            return {"success": True}
+
+        monkeypatch.setattr(manage_ui_mod, "send_mutation", fake_send)
+
+        run_async(manage_ui_mod.manage_ui(
+            ctx=DummyContext(), action="modify_visual_element",
+            target="Canvas", element_name="Title", add_classes=["big"],
+            visible=False,
+        ))
+        assert captured["params"] == {
+            "action": "modify_visual_element",
+            "target": "Canvas",
+            "elementName": "Title",
+            "addClasses": ["big"],
+            "visible": "false",
+        }
@@ -238,6 +238,7 @@ async def test_read_console_types_validation(monkeypatch):
     resp = await read_console(ctx=DummyContext(), action="get", types='["error", "nope"]')
     assert resp["success"] is False
     assert "invalid types entry" in resp["message"]
+    assert "Allowed values: ['all', 'error', 'log', 'warning']" in resp["message"]
     assert captured == {}
 
     # Non-string entry should return a clear error and not send.
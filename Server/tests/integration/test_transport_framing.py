@@ -201,3 +201,116 @@ def test_zero_length_payload_heartbeat():
         conn.disconnect()
 
 
+def test_legacy_receive_only_parses_chunks_that_can_complete_json(monkeypatch):
+    import transport.legacy.unity_connection as unity_connection
+
+    parses = []
+    real_loads = json.loads
+
+    def counting_loads(s, *args, **kwargs):
+        parses.append(len(s))
+        return real_loads(s, *args, **kwargs)
+
+    monkeypatch.setattr(unity_connection.json, "loads", counting_loads)
+
+    server, client = socket.socketpair()
+    try:
+        conn = UnityConnection(host="127.0.0.1", port=0)
+        conn.use_framing = False
+        server.sendall(b'{"status":"success",')
+        server.sendall(b'"result":{"items":[1,2,3]}}')
+        client.settimeout(1.0)
+        resp = conn.receive_full_response(client, buffer_size=16)
+        assert real_loads(resp) == {"status": "success", "result": {"items": [1, 2, 3]}}
+        assert len(parses) == 1
+    finally:
+        server.close()
+        client.close()
+
+
+def test_reload_backoff_retries_once_status_clears(monkeypatch, tmp_path):
+    import transport.legacy.unity_connection as unity_connection
+
+    status_dir = tmp_path / ".unity-mcp"
+    status_dir.mkdir()
+    status_file = status_dir / "unity-mcp-status-abc.json"
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(unity_connection.stdio_port_registry, "get_port", lambda *_: 0)
+    # Force a long reload backoff so an early wake-up is observable.
+    monkeypatch.setattr(unity_connection.random, "uniform", lambda a, b: 2.0)
+
+    connects = []
+
+    def fake_connect():
+        connects.append(1)
+        if len(connects) == 1:
+            status_file.write_text('{"reloading": true}')
+        raise ConnectionRefusedError("Unity is reloading")
+
+    sleeps = []
+    real_sleep = time.sleep
+    test_thread = threading.get_ident()
+
+    def fake_sleep(seconds):
+        # time.sleep is process-wide; leave dummy server threads alone.
+        if threading.get_ident() != test_thread:
+            return real_sleep(seconds)
+        sleeps.append(seconds)
+        status_file.write_text('{"reloading": false}')
+
+    monkeypatch.setattr(unity_connection.time, "sleep", fake_sleep)
+
+    conn = UnityConnection(host="127.0.0.1", port=0)
+    monkeypatch.setattr(conn, "connect", fake_connect)
+
+    with pytest.raises(ConnectionRefusedError):
+        conn.send_command("manage_scene", {"action": "get_active"}, max_attempts=1)
+
+    assert len(connects) == 2
+    assert sleeps == [unity_connection._RELOAD_POLL_S]
+
+
+def test_reload_backoff_ignores_unreadable_status(monkeypatch, tmp_path):
+    import transport.legacy.unity_connection as unity_connection
+
+    status_dir = tmp_path / ".unity-mcp"
+    status_dir.mkdir()
+    status_file = status_dir / "unity-mcp-status-abc.json"
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(unity_connection.stdio_port_registry, "get_port", lambda *_: 0)
+    monkeypatch.setattr(unity_connection.random, "uniform", lambda a, b: 2.0)
+
+    connects = []
+
+    def fake_connect():
+        connects.append(1)
+        if len(connects) == 1:
+            status_file.write_text('{"reloading": true}')
+        raise ConnectionRefusedError("Unity is reloading")
+
+    sleeps = []
+    real_sleep = time.sleep
+    test_thread = threading.get_ident()
+
+    def fake_sleep(seconds):
+        if threading.get_ident() != test_thread:
+            return real_sleep(seconds)
+        sleeps.append(seconds)
+        # A torn write leaves the status file unparseable mid-reload.
+        status_file.write_text('{"reloading": ')
+
+    monkeypatch.setattr(unity_connection.time, "sleep", fake_sleep)
+
+    conn = UnityConnection(host="127.0.0.1", port=0)
+    monkeypatch.setattr(conn, "connect", fake_connect)
+
+    with pytest.raises(ConnectionRefusedError):
+        conn.send_command("manage_scene", {"action": "get_active"}, max_attempts=1)
+
+    assert len(connects) == 2
+    # One poll slice, then the rest of the 2s backoff in a single sleep.
+    assert len(sleeps) == 2
+    assert sleeps[0] == unity_connection._RELOAD_POLL_S
+    assert sleeps[1] == pytest.approx(2.0, abs=0.05)
@@ -20,21 +20,21 @@ async def test_returns_immediately_in_pytest(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_polls_until_ready(monkeypatch):
-    """When not in pytest, the helper polls get_editor_state until ready_for_tools."""
+    """When not in pytest, the helper polls editor state until ready_for_tools."""
     monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
 
     from services.tools import refresh_unity as mod
 
     call_count = 0
 
-    async def fake_get_editor_state(ctx):
+    async def fake_fetch_editor_state(ctx, *, coalesce=True):
         nonlocal call_count
         call_count += 1
         if call_count < 3:
             return {"data": {"advice": {"ready_for_tools": False, "blocking_reasons": ["compiling"]}}}
         return {"data": {"advice": {"ready_for_tools": True, "blocking_reasons": []}}}
 
-    monkeypatch.setattr(mod.editor_state, "get_editor_state", fake_get_editor_state)
+    monkeypatch.setattr(mod.editor_state, "fetch_editor_state", fake_fetch_editor_state)
 
     ctx = DummyContext()
     ready, elapsed = await mod.wait_for_editor_ready(ctx, timeout_s=10.0)
@@ -50,10 +50,10 @@ async def test_timeout_returns_false(monkeypatch):
 
     from services.tools import refresh_unity as mod
 
-    async def fake_get_editor_state(ctx):
+    async def fake_fetch_editor_state(ctx, *, coalesce=True):
         return {"data": {"advice": {"ready_for_tools": False, "blocking_reasons": ["compiling"]}}}
 
-    monkeypatch.setattr(mod.editor_state, "get_editor_state", fake_get_editor_state)
+    monkeypatch.setattr(mod.editor_state, "fetch_editor_state", fake_fetch_editor_state)
 
     ctx = DummyContext()
     ready, elapsed = await mod.wait_for_editor_ready(ctx, timeout_s=0.6)
@@ -61,6 +61,39 @@ async def test_timeout_returns_false(monkeypatch):
     assert elapsed >= 0.5
 
 
+@pytest.mark.asyncio
+async def test_poll_interval_backs_off_to_cap(monkeypatch):
+    """Successive polls wait longer, up to the configured maximum."""
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+
+    from services.tools import refresh_unity as mod
+
+    async def fake_fetch_editor_state(ctx, *, coalesce=True):
+        return {"data": {"advice": {"ready_for_tools": False, "blocking_reasons": ["domain_reload"]}}}
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+    test_task = asyncio.current_task()
+
+    async def fake_sleep(delay, *args, **kwargs):
+        # asyncio.sleep is process-wide; leave other tasks alone.
+        if asyncio.current_task() is not test_task:
+            return await real_sleep(delay, *args, **kwargs)
+        sleeps.append(delay)
+        if len(sleeps) >= 10:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(mod.editor_state, "fetch_editor_state", fake_fetch_editor_state)
+    monkeypatch.setattr(mod.asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        await mod.wait_for_editor_ready(DummyContext(), timeout_s=60.0)
+
+    assert sleeps[0] == pytest.approx(mod._READY_POLL_INITIAL_S)
+    assert sleeps == sorted(sleeps)
+    assert sleeps[-1] == pytest.approx(mod._READY_POLL_MAX_S)
+
+
 @pytest.mark.asyncio
 async def test_stale_only_treated_as_ready(monkeypatch):
     """If the only blocking reason is stale_status, consider ready."""
@@ -68,10 +101,10 @@ async def test_stale_only_treated_as_ready(monkeypatch):
 
     from services.tools import refresh_unity as mod
 
-    async def fake_get_editor_state(ctx):
+    async def fake_fetch_editor_state(ctx, *, coalesce=True):
         return {"data": {"advice": {"ready_for_tools": False, "blocking_reasons": ["stale_status"]}}}
 
-    monkeypatch.setattr(mod.editor_state, "get_editor_state", fake_get_editor_state)
+    monkeypatch.setattr(mod.editor_state, "fetch_editor_state", fake_fetch_editor_state)
 
     ctx = DummyContext()
     ready, elapsed = await mod.wait_for_editor_ready(ctx, timeout_s=5.0)
@@ -80,21 +113,21 @@ async def test_stale_only_treated_as_ready(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_exception_during_poll_keeps_trying(monkeypatch):
-    """If get_editor_state throws, the helper keeps polling until ready."""
+    """If reading editor state throws, the helper keeps polling until ready."""
     monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
 
     from services.tools import refresh_unity as mod
 
     call_count = 0
 
-    async def fake_get_editor_state(ctx):
+    async def fake_fetch_editor_state(ctx, *, coalesce=True):
         nonlocal call_count
         call_count += 1
         if call_count < 3:
             raise ConnectionError("Unity disconnected")
         return {"data": {"advice": {"ready_for_tools": True, "blocking_reasons": []}}}
 
-    monkeypatch.setattr(mod.editor_state, "get_editor_state", fake_get_editor_state)
+    monkeypatch.setattr(mod.editor_state, "fetch_editor_state", fake_fetch_editor_state)
 
     ctx = DummyContext()
     ready, elapsed = await mod.wait_for_editor_ready(ctx, timeout_s=10.0)
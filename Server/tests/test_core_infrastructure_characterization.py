@@ -338,6 +338,23 @@ class TestTelemetryDecoratorBasics:
         assert result == "async_result_value"
         assert "telemetry_decorator async: tool=async_tool" in caplog_fixture.text
 
+    def test_telemetry_tool_records_sub_action(self, monkeypatch):
+        """Verify the action argument (including its default) is reported as sub_action."""
+        recorded = []
+        monkeypatch.setattr(
+            "core.telemetry_decorator.record_tool_usage",
+            lambda *args, **kwargs: recorded.append(kwargs.get("sub_action")),
+        )
+
+        @telemetry_tool("action_tool")
+        async def action_tool(ctx, action="get_hierarchy"):
+            return action
+
+        asyncio.run(action_tool(None))
+        asyncio.run(action_tool(None, action="create"))
+
+        assert recorded == ["get_hierarchy", "create"]
+
     def test_telemetry_resource_decorator_sync(self, caplog_fixture):
         """Verify telemetry_resource decorator works on sync functions."""
         caplog_fixture.clear()
@@ -589,3 +589,37 @@ def test_action_uppercase(mock_unity):
     )
     assert result["success"] is True
     assert mock_unity["params"]["action"] == "ping"
+
+
+# ---------------------------------------------------------------------------
+# Inline screenshot extraction
+# ---------------------------------------------------------------------------
+
+def test_batch_screenshots_become_summary_then_image_blocks():
+    import json
+    from services.tools.utils import extract_screenshot_images
+
+    response = {
+        "success": True,
+        "message": "ok",
+        "data": {
+            "sceneCenter": [0, 0, 0],
+            "sceneRadius": 5,
+            "screenshots": [
+                {"angle": "front", "imageBase64": "AAA"},
+                {"angle": "top"},
+                {"angle": "left", "imageBase64": "BBB"},
+            ],
+        },
+    }
+
+    content = extract_screenshot_images(response).content
+
+    summary = json.loads(content[0].text)
+    assert summary["data"]["screenshots"] == [
+        {"angle": "front"}, {"angle": "top"}, {"angle": "left"},
+    ]
+    assert [c.type for c in content[1:]] == ["text", "image", "text", "image"]
+    assert content[1].text == "[Angle: front]"
+    assert content[2].data == "AAA"
+    assert content[4].data == "BBB"
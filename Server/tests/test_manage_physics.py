@@ -267,3 +267,16 @@ def test_none_params_not_forwarded(mock_unity):
     # Only 'action' should be in params, no None values
     assert "dimension" not in mock_unity["params"]
     assert "target" not in mock_unity["params"]
+
+
+def test_component_index_maps_to_camel_case_key(mock_unity):
+    asyncio.run(
+        manage_physics(
+            SimpleNamespace(),
+            action="configure_joint",
+            target="Door",
+            component_index=1,
+        )
+    )
+    assert mock_unity["params"]["componentIndex"] == 1
+    assert "component_index" not in mock_unity["params"]
@@ -139,3 +139,51 @@ def test_none_params_omitted(mock_unity):
     assert "additive" not in params
     assert "template" not in params
     assert "autoRepair" not in params
+
+
+def test_loose_values_are_coerced_and_empty_name_dropped(mock_unity):
+    asyncio.run(manage_scene(
+        SimpleNamespace(), action="get_hierarchy", name="",
+        build_index="2", page_size="abc", include_transform="true",
+    ))
+    params = mock_unity["params"]
+    assert "name" not in params
+    assert params["buildIndex"] == 2
+    assert "pageSize" not in params
+    assert params["includeTransform"] is True
+
+
+# ── Concurrent reads ────────────────────────────────────────────────
+
+
+def _count_sends(monkeypatch):
+    calls: list[str] = []
+
+    async def slow_send(send_fn, unity_instance, tool_name, params):
+        calls.append(params["action"])
+        await asyncio.sleep(0.01)
+        return {"success": True, "message": "ok", "data": {"items": []}}
+
+    monkeypatch.setattr("services.tools.manage_scene.send_with_unity_instance", slow_send)
+    return calls
+
+
+async def _run_concurrently(action, n=3, **kwargs):
+    return await asyncio.gather(*(
+        manage_scene(SimpleNamespace(), action=action, **kwargs) for _ in range(n)
+    ))
+
+
+def test_concurrent_identical_reads_share_one_round_trip(mock_unity, monkeypatch):
+    calls = _count_sends(monkeypatch)
+    results = asyncio.run(_run_concurrently("get_hierarchy", page_size=50))
+    assert calls == ["get_hierarchy"]
+    assert all(r["success"] for r in results)
+    # The payload is only read, so callers share it rather than copying.
+    assert results[0]["data"] is results[1]["data"]
+
+
+def test_concurrent_mutations_are_not_coalesced(mock_unity, monkeypatch):
+    calls = _count_sends(monkeypatch)
+    asyncio.run(_run_concurrently("save"))
+    assert calls == ["save", "save", "save"]
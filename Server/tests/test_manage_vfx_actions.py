@@ -42,3 +42,52 @@ def test_manage_vfx_accepts_particle_create(monkeypatch) -> None:
         "target": "BudGrowth",
         "properties": {"position": [0, 1, 0]},
     }
+
+
+def test_manage_vfx_maps_wire_keys(monkeypatch) -> None:
+    captured: dict[str, object] = {}
+
+    async def fake_send_with_unity_instance(send_fn, unity_instance, tool_name, params):
+        captured["params"] = params
+        return {"success": True, "message": "ok"}
+
+    monkeypatch.setattr(
+        "services.tools.manage_vfx.get_unity_instance_from_context",
+        AsyncMock(return_value="unity-instance-1"),
+    )
+    monkeypatch.setattr(
+        "services.tools.manage_vfx.send_with_unity_instance",
+        fake_send_with_unity_instance,
+    )
+
+    asyncio.run(
+        manage_vfx(
+            SimpleNamespace(),
+            action="PARTICLE_PLAY",
+            target="Sparks",
+            search_method="by_name",
+            component_index=0,
+        )
+    )
+
+    assert captured["params"] == {
+        "action": "particle_play",
+        "target": "Sparks",
+        "searchMethod": "by_name",
+        "componentIndex": 0,
+    }
+
+
+def test_manage_vfx_rejects_unknown_action_without_rpc(monkeypatch) -> None:
+    send = AsyncMock()
+    monkeypatch.setattr(
+        "services.tools.manage_vfx.get_unity_instance_from_context",
+        AsyncMock(return_value="unity-instance-1"),
+    )
+    monkeypatch.setattr("services.tools.manage_vfx.send_with_unity_instance", send)
+
+    result = asyncio.run(manage_vfx(SimpleNamespace(), action="particle_explode"))
+
+    assert result["success"] is False
+    assert "particle_create" in result["message"]
+    send.assert_not_called()
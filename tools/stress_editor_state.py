@@ -25,6 +25,8 @@ import sys
 
 
 TIMEOUT = 5.0
+# The request never changes, so encode it once instead of on every poll.
+GET_EDITOR_STATE_FRAME = json.dumps({"type": "get_editor_state", "params": {}}).encode("utf-8")
 
 
 def find_status_files() -> list[Path]:
@@ -50,13 +52,10 @@ def discover_port(project_path: str | None) -> int:
 
 
 async def read_exact(reader: asyncio.StreamReader, n: int) -> bytes:
-    buf = b""
-    while len(buf) < n:
-        chunk = await reader.read(n - len(buf))
-        if not chunk:
-            raise ConnectionError("Connection closed while reading")
-        buf += chunk
-    return buf
+    try:
+        return await reader.readexactly(n)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed while reading") from e
 
 
 async def read_frame(reader: asyncio.StreamReader) -> bytes:
@@ -68,9 +67,7 @@ async def read_frame(reader: asyncio.StreamReader) -> bytes:
 
 
 async def write_frame(writer: asyncio.StreamWriter, payload: bytes) -> None:
-    header = struct.pack(">Q", len(payload))
-    writer.write(header)
-    writer.write(payload)
+    writer.write(struct.pack(">Q", len(payload)) + payload)
     await asyncio.wait_for(writer.drain(), timeout=TIMEOUT)
 
 
@@ -80,11 +77,6 @@ async def do_handshake(reader: asyncio.StreamReader) -> None:
         raise ConnectionError(f"Unexpected handshake from server: {line!r}")
 
 
-def make_get_editor_state_frame() -> bytes:
-    payload = {"type": "get_editor_state", "params": {}}
-    return json.dumps(payload).encode("utf-8")
-
-
 async def stress_loop(host: str, port: int, duration: float, interval: float, verbose: bool):
     stop_time = time.time() + duration
     stats = {"requests": 0, "errors": 0, "reconnects": 0}
@@ -112,7 +104,7 @@ async def stress_loop(host: str, port: int, duration: float, interval: float, ve
                         print(f"[{time.time():.2f}] Connected")
                 
                 # Send get_editor_state request
-                await write_frame(writer, make_get_editor_state_frame())
+                await write_frame(writer, GET_EDITOR_STATE_FRAME)
                 response = await asyncio.wait_for(read_frame(reader), timeout=TIMEOUT)
                 stats["requests"] += 1
                 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import asyncio
 import argparse
+import hashlib
 import json
 import os
 import struct
@@ -51,13 +52,10 @@ def discover_port(project_path: str | None) -> int:
 
 
 async def read_exact(reader: asyncio.StreamReader, n: int) -> bytes:
-    buf = b""
-    while len(buf) < n:
-        chunk = await reader.read(n - len(buf))
-        if not chunk:
-            raise ConnectionError("Connection closed while reading")
-        buf += chunk
-    return buf
+    try:
+        return await reader.readexactly(n)
+    except asyncio.IncompleteReadError as e:
+        raise ConnectionError("Connection closed while reading") from e
 
 
 async def read_frame(reader: asyncio.StreamReader) -> bytes:
@@ -69,9 +67,7 @@ async def read_frame(reader: asyncio.StreamReader) -> bytes:
 
 
 async def write_frame(writer: asyncio.StreamWriter, payload: bytes) -> None:
-    header = struct.pack(">Q", len(payload))
-    writer.write(header)
-    writer.write(payload)
+    writer.write(struct.pack(">Q", len(payload)) + payload)
     await asyncio.wait_for(writer.drain(), timeout=TIMEOUT)
 
 
@@ -135,6 +131,148 @@ async def client_loop(idx: int, host: str, port: int, stop_time: float, stats: d
                     pass
 
 
+def _unity_relative_path(tpath: Path, proj_root: Path | None) -> str | None:
+    # Derive Unity-relative path under Assets/ (cross-platform)
+    try:
+        resolved = tpath.resolve()
+        parts = list(resolved.parts)
+        if "Assets" in parts:
+            i = parts.index("Assets")
+            return Path(*parts[i:]).as_posix()
+        if proj_root and str(resolved).startswith(str(proj_root)):
+            rel = resolved.relative_to(proj_root)
+            parts2 = list(rel.parts)
+            if "Assets" in parts2:
+                i2 = parts2.index("Assets")
+                return Path(*parts2[i2:]).as_posix()
+    except Exception:
+        pass
+    return None
+
+
+class ScriptSession:
+    """One bridge connection reused for a script's read and apply requests."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, payload: dict) -> dict:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), timeout=TIMEOUT)
+            await asyncio.wait_for(do_handshake(self.reader), timeout=TIMEOUT)
+        await write_frame(self.writer, json.dumps(payload).encode("utf-8"))
+        resp = await asyncio.wait_for(read_frame(self.reader), timeout=TIMEOUT)
+        obj = json.loads(resp.decode("utf-8", errors="ignore"))
+        return obj.get("result", obj) if isinstance(obj, dict) else {}
+
+    async def close(self) -> None:
+        # Dropped after any failure so the next attempt reconnects
+        writer, self.reader, self.writer = self.writer, None, None
+        if writer is not None:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+
+async def touch_script(relative: str, seq: int, host: str, port: int, stats: dict):
+    session = ScriptSession(host, port)
+    try:
+        await _touch_script(session, relative, seq, stats)
+    finally:
+        await session.close()
+
+
+async def _touch_script(session: ScriptSession, relative: str, seq: int, stats: dict):
+    # Derive name and directory for ManageScript and compute precondition SHA + EOF position
+    name_base = Path(relative).stem
+    dir_path = str(
+        Path(relative).parent).replace('\\', '/')
+
+    # 1) Read current contents via manage_script.read to compute SHA and true EOF location
+    read_payload = {
+        "type": "manage_script",
+        "params": {
+            "action": "read",
+            "name": name_base,
+            "path": dir_path
+        }
+    }
+    contents = None
+    read_success = False
+    for attempt in range(3):
+        try:
+            result = await session.request(read_payload)
+            if result.get("success"):
+                data_obj = result.get("data", {})
+                contents = data_obj.get("contents") or ""
+                read_success = True
+                break
+        except Exception:
+            # retry with backoff on a fresh connection
+            await session.close()
+            await asyncio.sleep(0.2 * (2 ** attempt) + random.uniform(0.0, 0.1))
+
+    if not read_success or contents is None:
+        stats["apply_errors"] = stats.get(
+            "apply_errors", 0) + 1
+        await asyncio.sleep(0.5)
+        return
+
+    # Compute SHA and EOF insertion point
+    sha = hashlib.sha256(
+        contents.encode("utf-8")).hexdigest()
+    lines = contents.splitlines(keepends=True)
+    # Insert at true EOF (safe against header guards)
+    end_line = len(lines) + 1  # 1-based exclusive end
+    end_col = 1
+
+    # Build a unique marker append; ensure it begins with a newline if needed
+    marker = f"// MCP_STRESS seq={seq} time={int(time.time())}"
+    insert_text = ("\n" if not contents.endswith(
+        "\n") else "") + marker + "\n"
+
+    # 2) Apply text edits with immediate refresh and precondition, reusing the read's connection
+    apply_payload = {
+        "type": "manage_script",
+        "params": {
+            "action": "apply_text_edits",
+            "name": name_base,
+            "path": dir_path,
+            "edits": [
+                {
+                    "startLine": end_line,
+                    "startCol": end_col,
+                    "endLine": end_line,
+                    "endCol": end_col,
+                    "newText": insert_text
+                }
+            ],
+            "precondition_sha256": sha,
+            "options": {"refresh": "immediate", "validate": "standard"}
+        }
+    }
+
+    for attempt in range(3):
+        try:
+            result = await session.request(apply_payload)
+            if bool(result.get("success", False)):
+                stats["applies"] = stats.get(
+                    "applies", 0) + 1
+                return
+        except Exception:
+            # retry with backoff on a fresh connection
+            await session.close()
+            await asyncio.sleep(0.2 * (2 ** attempt) + random.uniform(0.0, 0.1))
+    stats["apply_errors"] = stats.get(
+        "apply_errors", 0) + 1
+
+
 async def reload_churn_task(project_path: str, stop_time: float, unity_file: str | None, host: str, port: int, stats: dict, storm_count: int = 1):
     # Use script edit tool to touch a C# file, which triggers compilation reliably
     path = Path(unity_file) if unity_file else None
@@ -163,147 +301,14 @@ async def reload_churn_task(project_path: str, stop_time: float, unity_file: str
                 else:
                     targets = [path]
 
+                # Targets are distinct files, so a storm touches them concurrently.
+                touches = []
                 for tpath in targets:
-                    # Build a tiny ApplyTextEdits request that toggles a trailing comment
-                    relative = None
-                    try:
-                        # Derive Unity-relative path under Assets/ (cross-platform)
-                        resolved = tpath.resolve()
-                        parts = list(resolved.parts)
-                        if "Assets" in parts:
-                            i = parts.index("Assets")
-                            relative = Path(*parts[i:]).as_posix()
-                        elif proj_root and str(resolved).startswith(str(proj_root)):
-                            rel = resolved.relative_to(proj_root)
-                            parts2 = list(rel.parts)
-                            if "Assets" in parts2:
-                                i2 = parts2.index("Assets")
-                                relative = Path(*parts2[i2:]).as_posix()
-                    except Exception:
-                        relative = None
-
+                    relative = _unity_relative_path(tpath, proj_root)
                     if relative:
-                        # Derive name and directory for ManageScript and compute precondition SHA + EOF position
-                        name_base = Path(relative).stem
-                        dir_path = str(
-                            Path(relative).parent).replace('\\', '/')
-
-                        # 1) Read current contents via manage_script.read to compute SHA and true EOF location
-                        contents = None
-                        read_success = False
-                        for attempt in range(3):
-                            writer = None
-                            try:
-                                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=TIMEOUT)
-                                await asyncio.wait_for(do_handshake(reader), timeout=TIMEOUT)
-                                read_payload = {
-                                    "type": "manage_script",
-                                    "params": {
-                                        "action": "read",
-                                        "name": name_base,
-                                        "path": dir_path
-                                    }
-                                }
-                                await write_frame(writer, json.dumps(read_payload).encode("utf-8"))
-                                resp = await asyncio.wait_for(read_frame(reader), timeout=TIMEOUT)
-
-                                read_obj = json.loads(
-                                    resp.decode("utf-8", errors="ignore"))
-                                result = read_obj.get("result", read_obj) if isinstance(
-                                    read_obj, dict) else {}
-                                if result.get("success"):
-                                    data_obj = result.get("data", {})
-                                    contents = data_obj.get("contents") or ""
-                                    read_success = True
-                                    break
-                            except Exception:
-                                # retry with backoff
-                                await asyncio.sleep(0.2 * (2 ** attempt) + random.uniform(0.0, 0.1))
-                            finally:
-                                if 'writer' in locals() and writer is not None:
-                                    try:
-                                        writer.close()
-                                        await writer.wait_closed()
-                                    except Exception:
-                                        pass
-
-                        if not read_success or contents is None:
-                            stats["apply_errors"] = stats.get(
-                                "apply_errors", 0) + 1
-                            await asyncio.sleep(0.5)
-                            continue
-
-                        # Compute SHA and EOF insertion point
-                        import hashlib
-                        sha = hashlib.sha256(
-                            contents.encode("utf-8")).hexdigest()
-                        lines = contents.splitlines(keepends=True)
-                        # Insert at true EOF (safe against header guards)
-                        end_line = len(lines) + 1  # 1-based exclusive end
-                        end_col = 1
-
-                        # Build a unique marker append; ensure it begins with a newline if needed
-                        marker = f"// MCP_STRESS seq={seq} time={int(time.time())}"
+                        touches.append(touch_script(relative, seq, host, port, stats))
                         seq += 1
-                        insert_text = ("\n" if not contents.endswith(
-                            "\n") else "") + marker + "\n"
-
-                        # 2) Apply text edits with immediate refresh and precondition
-                        apply_payload = {
-                            "type": "manage_script",
-                            "params": {
-                                "action": "apply_text_edits",
-                                "name": name_base,
-                                "path": dir_path,
-                                "edits": [
-                                    {
-                                        "startLine": end_line,
-                                        "startCol": end_col,
-                                        "endLine": end_line,
-                                        "endCol": end_col,
-                                        "newText": insert_text
-                                    }
-                                ],
-                                "precondition_sha256": sha,
-                                "options": {"refresh": "immediate", "validate": "standard"}
-                            }
-                        }
-
-                        apply_success = False
-                        for attempt in range(3):
-                            writer = None
-                            try:
-                                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=TIMEOUT)
-                                await asyncio.wait_for(do_handshake(reader), timeout=TIMEOUT)
-                                await write_frame(writer, json.dumps(apply_payload).encode("utf-8"))
-                                resp = await asyncio.wait_for(read_frame(reader), timeout=TIMEOUT)
-                                try:
-                                    data = json.loads(resp.decode(
-                                        "utf-8", errors="ignore"))
-                                    result = data.get("result", data) if isinstance(
-                                        data, dict) else {}
-                                    ok = bool(result.get("success", False))
-                                    if ok:
-                                        stats["applies"] = stats.get(
-                                            "applies", 0) + 1
-                                        apply_success = True
-                                        break
-                                except Exception:
-                                    # fall through to retry
-                                    pass
-                            except Exception:
-                                # retry with backoff
-                                await asyncio.sleep(0.2 * (2 ** attempt) + random.uniform(0.0, 0.1))
-                            finally:
-                                if 'writer' in locals() and writer is not None:
-                                    try:
-                                        writer.close()
-                                        await writer.wait_closed()
-                                    except Exception:
-                                        pass
-                        if not apply_success:
-                            stats["apply_errors"] = stats.get(
-                                "apply_errors", 0) + 1
+                await asyncio.gather(*touches)
 
         except Exception:
             pass